@@ -9,24 +9,45 @@ Provides commands:
   - /deletetimer: removes a scheduled feeding time
 """
 
+import asyncio
+import atexit
+import bisect
 import configparser
+import contextlib
 import json
 import logging
+import os
+import queue
+import re
 import sys
 import zoneinfo
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import time
+from logging.handlers import (
+    MemoryHandler,
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+)
 from pathlib import Path
-from typing import Final
+from time import monotonic
+from typing import TYPE_CHECKING, Final
 
-import tinytuya
-from telegram import Update
+from telegram import Message, Update
+from telegram.error import RetryAfter
 from telegram.ext import (
     Application,
     CommandHandler,
     ContextTypes,
     JobQueue,
+    filters,
 )
 
+if TYPE_CHECKING:
+    import tinytuya
+
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
@@ -34,27 +55,62 @@ from telegram.ext import (
 CONFIG_PATH: Final[str] = str(Path(__file__).resolve().parent / "petfeeder.conf")
 DATA_DIR: Final[Path] = Path(__file__).resolve().parent / "data"
 TIMERS_PATH: Final[str] = str(DATA_DIR / "timers.json")
-USERS_PATH: Final[str] = str(DATA_DIR / "allowed_users.json")
+USERS_PATH: Final[str] = str(DATA_DIR / "allowed_users.jsonl")
+# JSON list written by earlier versions; still read on startup if present
+LEGACY_USERS_PATH: Final[str] = str(DATA_DIR / "allowed_users.json")
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Settings read from the configuration file.
+
+    Secrets are excluded from the repr so the object is safe to log.
+    """
+
+    bot_token: str = field(repr=False)
+    allowed_user_ids: frozenset[int]
+    device_id: str
+    ip_address: str
+    local_key: str = field(repr=False)
+    device_version: float
+    feed_dp: str
+    portions: int
+    timezone: zoneinfo.ZoneInfo
+    log_level: str
+    log_file: str
+
+
+# Last loaded settings, keyed by (path, mtime in ns, size) of the config file
+_CONFIG_CACHE: tuple[tuple[str, int, int], Settings] | None = None
 
 
-def load_config(path: str = CONFIG_PATH) -> configparser.ConfigParser:
+def load_config(path: str = CONFIG_PATH) -> Settings:
     """Read and validate the configuration file.
 
+    The result is cached; the file is parsed again only if its modification
+    time or size has changed since the previous call.
+
     Args:
         path: Absolute or relative path to the .conf file.
 
     Returns:
-        Parsed ConfigParser instance.
+        Settings parsed from the file.
 
     Raises:
         FileNotFoundError: If the configuration file does not exist.
         KeyError: If a required section or option is missing.
     """
-    config = configparser.ConfigParser()
+    global _CONFIG_CACHE
 
     if not Path(path).is_file():
         raise FileNotFoundError(f"Configuration file not found: {path}")
 
+    stat = Path(path).stat()
+    cache_key = (path, stat.st_mtime_ns, stat.st_size)
+    if _CONFIG_CACHE is not None and _CONFIG_CACHE[0] == cache_key:
+        return _CONFIG_CACHE[1]
+
+    config = configparser.ConfigParser()
     config.read(path, encoding="utf-8")
 
     required_sections = {
@@ -76,61 +132,60 @@ def load_config(path: str = CONFIG_PATH) -> configparser.ConfigParser:
             if not config.get(section, key, fallback=""):
                 raise KeyError(f"Missing required config option: [{section}] {key}")
 
-    return config
+    # IDs may be separated by commas and/or whitespace
+    raw_user_ids = config.get("telegram", "allowed_user_ids")
+    settings = Settings(
+        bot_token=config.get("telegram", "bot_token"),
+        allowed_user_ids=frozenset(map(int, raw_user_ids.replace(",", " ").split())),
+        device_id=config.get("device", "device_id"),
+        ip_address=config.get("device", "ip_address"),
+        local_key=config.get("device", "local_key"),
+        device_version=config.getfloat("device", "version"),
+        feed_dp=config.get("device", "feed_dp"),
+        portions=config.getint("device", "portions"),
+        timezone=zoneinfo.ZoneInfo(config.get("general", "timezone", fallback="UTC")),
+        log_level=config.get("logging", "level", fallback="INFO").upper(),
+        log_file=config.get("logging", "file", fallback=""),
+    )
+    _CONFIG_CACHE = (cache_key, settings)
+    return settings
 
 
-CONFIG: Final[configparser.ConfigParser] = load_config()
+SETTINGS: Final[Settings] = load_config()
 
 # Telegram settings
-BOT_TOKEN: Final[str] = CONFIG.get("telegram", "bot_token")
-_config_user_ids: set[int] = set(
-    int(uid.strip())
-    for uid in CONFIG.get("telegram", "allowed_user_ids").split(",")
-    if uid.strip()
-)
-
-
-def load_allowed_user_ids() -> set[int]:
-    """Load dynamically added user IDs from the persistent JSON file.
-
-    Merges them with the user IDs defined in the config file.
-
-    Returns:
-        Combined set of allowed user IDs.
-    """
-    ids = set(_config_user_ids)
-    if Path(USERS_PATH).is_file():
-        try:
-            with open(USERS_PATH, "r", encoding="utf-8") as f:
-                saved = json.load(f)
-                ids.update(int(uid) for uid in saved)
-                logger.info("Loaded saved user IDs: %s", saved)
-        except Exception as e:
-            logger.error("Failed to load saved user IDs: %s", e)
-    return ids
-
-
-ALLOWED_USER_IDS: set[int] = load_allowed_user_ids()
+BOT_TOKEN: Final[str] = SETTINGS.bot_token
 
 # Device settings
-DEVICE_ID: Final[str] = CONFIG.get("device", "device_id")
-IP_ADDRESS: Final[str] = CONFIG.get("device", "ip_address")
-LOCAL_KEY: Final[str] = CONFIG.get("device", "local_key")
-DEVICE_VERSION: Final[float] = CONFIG.getfloat("device", "version")
-FEED_DP: Final[str] = CONFIG.get("device", "feed_dp")
-PORTIONS: Final[int] = CONFIG.getint("device", "portions")
+DEVICE_ID: Final[str] = SETTINGS.device_id
+IP_ADDRESS: Final[str] = SETTINGS.ip_address
+LOCAL_KEY: Final[str] = SETTINGS.local_key
+DEVICE_VERSION: Final[float] = SETTINGS.device_version
+FEED_DP: Final[str] = SETTINGS.feed_dp
+PORTIONS: Final[int] = SETTINGS.portions
 
 # Timezone
-TIMEZONE: Final[zoneinfo.ZoneInfo] = zoneinfo.ZoneInfo(
-    CONFIG.get("general", "timezone", fallback="UTC")
-)
+TIMEZONE: Final[zoneinfo.ZoneInfo] = SETTINGS.timezone
 
 # Logging settings
-LOG_LEVEL: Final[str] = CONFIG.get("logging", "level", fallback="INFO").upper()
-LOG_FILE: Final[str] = CONFIG.get("logging", "file", fallback="")
+LOG_LEVEL: Final[str] = SETTINGS.log_level
+LOG_FILE: Final[str] = SETTINGS.log_file
+LOG_MAX_BYTES: Final[int] = 1_000_000
+LOG_BACKUP_COUNT: Final[int] = 3
+LOG_BUFFER_CAPACITY: Final[int] = 200
+
+# Human-readable names for known device data points
+DP_NAMES: Final[dict[str, str]] = {
+    "3": "manual_feed",
+    "4": "feed_state",
+    "11": "charge_state",
+    "14": "feed_report",
+}
 
 # Timer storage
 TIMERS: dict[str, dict] = {}  # Format: {"HH:MM": {"portions": int, "job": Job}}
+# Keys of TIMERS kept in sorted (i.e. chronological) order for listing
+_TIMER_KEYS_SORTED: list[str] = []
 
 # ---------------------------------------------------------------------------
 # Logging setup
@@ -138,19 +193,49 @@ TIMERS: dict[str, dict] = {}  # Format: {"HH:MM": {"portions": int, "job": Job}}
 
 
 def setup_logging() -> None:
-    """Configure the root logger based on settings from the config file."""
-    handlers: list[logging.Handler] = [logging.StreamHandler(sys.stdout)]
-
-    if LOG_FILE:
-        handlers.append(logging.FileHandler(LOG_FILE, encoding="utf-8"))
+    """Configure the root logger based on settings from the config file.
 
-    logging.basicConfig(
-        level=getattr(logging, LOG_LEVEL, logging.INFO),
-        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    Records are passed through a queue to a background listener thread that
+    writes them out, so logging from async handlers never blocks on I/O.
+    File output is rotated and buffered in memory, then written out every
+    LOG_BUFFER_CAPACITY records or as soon as a WARNING or higher arrives.
+    """
+    formatter = logging.Formatter(
+        fmt="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
-        handlers=handlers,
     )
 
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+    handlers: list[logging.Handler] = [stream_handler]
+
+    if LOG_FILE:
+        file_handler = RotatingFileHandler(
+            LOG_FILE,
+            maxBytes=LOG_MAX_BYTES,
+            backupCount=LOG_BACKUP_COUNT,
+            encoding="utf-8",
+        )
+        file_handler.setFormatter(formatter)
+        buffer_handler = MemoryHandler(
+            capacity=LOG_BUFFER_CAPACITY,
+            flushLevel=logging.WARNING,
+            target=file_handler,
+        )
+        handlers.append(buffer_handler)
+        # atexit runs callbacks in reverse order: this flush runs after the
+        # listener below has been stopped and has drained the queue
+        atexit.register(buffer_handler.flush)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers)
+    listener.start()
+    atexit.register(listener.stop)
+
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, LOG_LEVEL, logging.INFO))
+    root.addHandler(QueueHandler(log_queue))
+
 
 setup_logging()
 logger: Final[logging.Logger] = logging.getLogger(__name__)
@@ -160,26 +245,60 @@ logger: Final[logging.Logger] = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 
-def get_device() -> tinytuya.OutletDevice:
-    """Create and return a configured Tuya device instance.
+# Shared device instance, created on first use
+_DEVICE: "tinytuya.OutletDevice | None" = None
+# Tuya devices accept a single local connection, so all device I/O runs on
+# one dedicated worker thread; concurrent requests queue up behind it
+_DEVICE_EXECUTOR: Final[ThreadPoolExecutor] = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="tuya"
+)
+
+# Successful status replies are reused for this many seconds
+STATUS_CACHE_TTL: Final[float] = 2.0
+_STATUS_CACHE: tuple[float, dict] | None = None  # (monotonic timestamp, status)
+# Status query currently running on the device, shared by concurrent callers
+_status_inflight: asyncio.Future | None = None
+
+# Feed command data for the default portion count, built once
+_DEFAULT_FEED_DPS: Final[dict[str, int]] = {FEED_DP: PORTIONS}
+
+
+def get_device() -> "tinytuya.OutletDevice":
+    """Return the shared Tuya device instance, creating it on first use.
+
+    Each command opens a fresh connection. A persistent socket would keep
+    unread frames (feed acknowledgements, status pushes) buffered, and
+    tinytuya would hand them back as the reply to the next status query.
 
     Returns:
         A tinytuya OutletDevice ready for communication.
     """
-    device = tinytuya.OutletDevice(DEVICE_ID, IP_ADDRESS, LOCAL_KEY)
-    device.set_version(DEVICE_VERSION)
-    return device
+    global _DEVICE
+    if _DEVICE is None:
+        # Imported on first use: tinytuya pulls in a sizeable dependency chain
+        # that is not needed until the feeder is actually contacted
+        import tinytuya
+
+        device = tinytuya.OutletDevice(DEVICE_ID, IP_ADDRESS, LOCAL_KEY)
+        device.set_version(DEVICE_VERSION)
+        # Send small command frames immediately instead of Nagle-buffering them
+        device.set_socketNODELAY(True)
+        _DEVICE = device
+    return _DEVICE
 
 
 def query_status() -> dict:
     """Query the device and return its current status dictionary.
 
+    tinytuya reports a connection failure in the returned dict rather
+    than raising.
+
     Returns:
         Raw status dict from the device, or a dict with an 'Error' key.
     """
-    device = get_device()
-    status = device.status()
-    logger.info("Device status queried: %s", status)
+    status = get_device().status()
+    logger.info("Device status queried")
+    logger.debug("Device status: %s", status)
     return status
 
 
@@ -192,13 +311,83 @@ def trigger_feed(portions: int = PORTIONS) -> dict:
     Returns:
         Raw response dict from the device.
     """
+    from tinytuya import CONTROL
+
     device = get_device()
-    payload = device.generate_payload(tinytuya.CONTROL, {FEED_DP: portions})
+    dps = _DEFAULT_FEED_DPS if portions == PORTIONS else {FEED_DP: portions}
+    payload = device.generate_payload(CONTROL, dps)
+    # Not retried here, but tinytuya itself resends the payload (up to
+    # socketRetryLimit times) when the reply times out, so a feed whose
+    # acknowledgement is lost may be dispensed more than once
     result = device.send(payload)
-    logger.info("Feed command sent (%d portion(s)): %s", portions, result)
+    logger.info("Feed command sent (%d portion(s))", portions)
+    logger.debug("Feed command response: %s", result)
+    invalidate_status_cache()
     return result
 
 
+async def run_device_io(func: Callable[..., dict], *args: object) -> dict:
+    """Run a blocking device call on the device worker thread.
+
+    Args:
+        func: Device helper to call, e.g. query_status or trigger_feed.
+        *args: Positional arguments passed to func.
+
+    Returns:
+        Whatever func returns.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_DEVICE_EXECUTOR, func, *args)
+
+
+def invalidate_status_cache() -> None:
+    """Drop the cached device status so the next request queries the device."""
+    global _STATUS_CACHE
+    _STATUS_CACHE = None
+
+
+async def _refresh_status() -> dict:
+    """Query the device and cache the status if the query succeeded."""
+    global _STATUS_CACHE
+    status = await run_device_io(query_status)
+    if isinstance(status, dict) and "Error" not in status:
+        _STATUS_CACHE = (monotonic(), status)
+    return status
+
+
+async def query_status_async() -> dict:
+    """Return the device status, reusing a recent result when available.
+
+    Concurrent callers share a single in-flight device query and all receive
+    its outcome, including errors, instead of each querying the feeder.
+
+    Returns:
+        Status dict as returned by query_status().
+    """
+    global _status_inflight
+    if _STATUS_CACHE is not None:
+        timestamp, status = _STATUS_CACHE
+        if monotonic() - timestamp < STATUS_CACHE_TTL:
+            return status
+
+    if _status_inflight is None or _status_inflight.done():
+        _status_inflight = asyncio.ensure_future(_refresh_status())
+    # Shielded so that one cancelled caller does not cancel the shared query
+    return await asyncio.shield(_status_inflight)
+
+
+async def trigger_feed_async(portions: int = PORTIONS) -> dict:
+    """Send a feed command without blocking the event loop.
+
+    Args:
+        portions: Number of food portions to dispense.
+
+    Returns:
+        Raw response dict from the device.
+    """
+    return await run_device_io(trigger_feed, portions)
+
+
 # ---------------------------------------------------------------------------
 # Authorization
 # ---------------------------------------------------------------------------
@@ -216,15 +405,212 @@ def is_authorized(user_id: int) -> bool:
     return user_id in ALLOWED_USER_IDS
 
 
-def save_allowed_user_ids() -> None:
-    """Persist the current ALLOWED_USER_IDS to a JSON file in the data directory."""
+def load_allowed_user_ids() -> frozenset[int]:
+    """Load dynamically added user IDs from the data directory.
+
+    Merges them with the user IDs defined in the config file.
+
+    Returns:
+        Combined set of allowed user IDs.
+    """
+    ids = set(SETTINGS.allowed_user_ids)
+    if Path(LEGACY_USERS_PATH).is_file():
+        try:
+            with open(LEGACY_USERS_PATH, "r", encoding="utf-8") as f:
+                ids.update(int(uid) for uid in json.load(f))
+        except Exception as e:
+            logger.error(
+                "Failed to load saved user IDs from %s: %s", LEGACY_USERS_PATH, e
+            )
+    if Path(USERS_PATH).is_file():
+        try:
+            saved = read_saved_user_ids(USERS_PATH)
+            ids.update(saved)
+            logger.info("Loaded %d saved user ID(s)", len(saved))
+            logger.debug("Loaded saved user IDs: %s", saved)
+        except Exception as e:
+            logger.error("Failed to load saved user IDs: %s", e)
+    return frozenset(ids)
+
+
+def read_saved_user_ids(path: str) -> list[int]:
+    """Parse the append-only user list, skipping damaged lines.
+
+    A last line without a trailing newline is an interrupted append and may
+    hold a truncated ID, so it is ignored rather than trusted. Other lines
+    that do not parse are logged and skipped individually.
+
+    Args:
+        path: Path to the user list file.
+
+    Returns:
+        User IDs read from the file, in file order.
+    """
+    saved = []
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for lineno, line in enumerate(f, start=1):
+            if not line.endswith("\n"):
+                logger.warning("Ignoring incomplete last line %d in %s", lineno, path)
+                break
+            if not line.strip():
+                continue
+            try:
+                saved.append(int(line))
+            except ValueError:
+                logger.warning("Skipping invalid line %d in %s", lineno, path)
+    return saved
+
+
+# Never mutated in place: /adduser rebinds it to a new frozenset
+ALLOWED_USER_IDS: frozenset[int] = load_allowed_user_ids()
+# Filter for protected commands; updates from other users never reach them
+AUTHORIZED_USERS: Final[filters.User] = filters.User(user_id=ALLOWED_USER_IDS)
+
+
+def append_allowed_user_id(user_id: int) -> None:
+    """Append a newly allowed user ID to the persistent user list.
+
+    The file is append-only (one ID per line), so adding a user never
+    rewrites the existing entries. If an earlier append was cut short, its
+    incomplete line is dropped first, so the remnant can neither merge with
+    the new entry nor be completed into a valid but wrong ID.
+
+    Args:
+        user_id: Telegram user ID to persist.
+    """
     DATA_DIR.mkdir(parents=True, exist_ok=True)
     try:
-        with open(USERS_PATH, "w", encoding="utf-8") as f:
-            json.dump(sorted(ALLOWED_USER_IDS), f, indent=2)
-        logger.info("allowed_user_ids saved to %s: %s", USERS_PATH, ALLOWED_USER_IDS)
+        with open(USERS_PATH, "ab+") as f:
+            f.seek(0)
+            data = f.read()
+            complete = data.rfind(b"\n") + 1
+            if complete != len(data):
+                logger.warning("Dropping incomplete last line in %s", USERS_PATH)
+                f.truncate(complete)
+            f.write(b"%d\n" % user_id)
+            f.flush()
+            os.fsync(f.fileno())
+        logger.info("User ID %d saved to %s", user_id, USERS_PATH)
     except Exception as e:
-        logger.error("Failed to save allowed user IDs: %s", e)
+        logger.error("Failed to save allowed user ID %d: %s", user_id, e)
+
+
+# ---------------------------------------------------------------------------
+# Rate limiting
+# ---------------------------------------------------------------------------
+
+# Device commands allowed per user: RATE_LIMIT_BURST at once, refilled at
+# RATE_LIMIT_RATE per second (Telegram allows ~1 message per second per chat)
+RATE_LIMIT_RATE: Final[float] = 1.0
+RATE_LIMIT_BURST: Final[int] = 3
+
+# "Access denied" replies sent to unauthorized users: one per minute each
+DENIED_REPLY_RATE: Final[float] = 1 / 60
+DENIED_REPLY_BURST: Final[int] = 1
+# Refilled buckets are dropped once this many unauthorized users are tracked
+DENIED_BUCKETS_PRUNE_SIZE: Final[int] = 1024
+
+# Token buckets: {user_id: (tokens, monotonic timestamp of last update)}
+_BUCKETS: dict[int, tuple[float, float]] = {}
+_DENIED_BUCKETS: dict[int, tuple[float, float]] = {}
+
+
+def allow_request(
+    user_id: int,
+    buckets: dict[int, tuple[float, float]] = _BUCKETS,
+    rate: float = RATE_LIMIT_RATE,
+    burst: int = RATE_LIMIT_BURST,
+) -> bool:
+    """Consume one token from the user's bucket if available.
+
+    Args:
+        user_id: Telegram user ID making the request.
+        buckets: Token bucket storage to use.
+        rate: Tokens refilled per second.
+        burst: Maximum number of tokens in a bucket.
+
+    Returns:
+        True if the request may proceed, False if the user is rate limited.
+    """
+    now = monotonic()
+    tokens, updated = buckets.get(user_id, (burst, now))
+    tokens = min(burst, tokens + (now - updated) * rate)
+
+    if tokens < 1:
+        buckets[user_id] = (tokens, now)
+        return False
+
+    buckets[user_id] = (tokens - 1, now)
+    return True
+
+
+def prune_buckets(
+    buckets: dict[int, tuple[float, float]],
+    rate: float,
+    burst: int,
+) -> None:
+    """Drop buckets that have refilled completely.
+
+    A full bucket behaves exactly like a missing one, so removing it does
+    not change any rate limiting decision.
+
+    Args:
+        buckets: Token bucket storage to prune in place.
+        rate: Tokens refilled per second.
+        burst: Maximum number of tokens in a bucket.
+    """
+    now = monotonic()
+    full = [
+        user_id
+        for user_id, (tokens, updated) in buckets.items()
+        if tokens + (now - updated) * rate >= burst
+    ]
+    for user_id in full:
+        del buckets[user_id]
+
+
+# ---------------------------------------------------------------------------
+# Outgoing replies
+# ---------------------------------------------------------------------------
+
+# How long shutdown waits for queued replies to be sent
+REPLY_DRAIN_TIMEOUT: Final[float] = 5.0
+
+# Non-critical replies waiting for the background sender: (message, text, kwargs)
+_REPLY_QUEUE: Final[asyncio.Queue[tuple[Message, str, dict]]] = asyncio.Queue()
+_reply_sender_task: asyncio.Task | None = None
+
+
+def enqueue_reply(message: Message, text: str, **kwargs: object) -> None:
+    """Queue a reply for the background sender instead of awaiting it.
+
+    Meant for usage hints, validation errors and similar acknowledgements,
+    so a handler does not stall when Telegram throttles the bot.
+
+    Args:
+        message: Message to reply to.
+        text: Reply text.
+        **kwargs: Extra arguments for Message.reply_text().
+    """
+    _REPLY_QUEUE.put_nowait((message, text, kwargs))
+
+
+async def reply_sender() -> None:
+    """Send queued replies in order, waiting out Telegram rate limits."""
+    while True:
+        message, text, kwargs = await _REPLY_QUEUE.get()
+        try:
+            while True:
+                try:
+                    await message.reply_text(text, **kwargs)
+                    break
+                except RetryAfter as e:
+                    logger.warning("Rate limited by Telegram for %ss", e.retry_after)
+                    await asyncio.sleep(e.retry_after)
+        except Exception as e:
+            logger.error("Failed to send queued reply: %s", e)
+        finally:
+            _REPLY_QUEUE.task_done()
 
 
 # ---------------------------------------------------------------------------
@@ -244,36 +630,113 @@ def load_timers() -> dict[str, dict]:
     try:
         with open(TIMERS_PATH, "r", encoding="utf-8") as f:
             data = json.load(f)
-            logger.info("Loaded timers from file: %s", data)
+            logger.info("Loaded %d timer(s) from file", len(data))
+            logger.debug("Loaded timers: %s", data)
             return data
     except Exception as e:
         logger.error("Failed to load timers: %s", e)
         return {}
 
 
-def save_timers() -> None:
-    """Persist timer configuration to JSON file (without job objects)."""
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
-    data = {
+def write_json_atomic(path: str, data: object) -> None:
+    """Write data as JSON so that the file is either fully old or fully new.
+
+    The data is written and fsynced to a temporary file next to the target,
+    which is then atomically renamed over it.
+
+    Args:
+        path: Destination file path.
+        data: JSON-serializable object to write.
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, separators=(",", ":"))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def serialize_timers() -> dict[str, dict]:
+    """Return the timer configuration without job objects.
+
+    Returns:
+        Dictionary in the format stored in the timers file.
+    """
+    return {
         timer_key: {"portions": info["portions"]} for timer_key, info in TIMERS.items()
     }
+
+
+def save_timers(data: dict[str, dict]) -> None:
+    """Persist timer configuration to JSON file.
+
+    Args:
+        data: Timer configuration as returned by serialize_timers().
+    """
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
     try:
-        with open(TIMERS_PATH, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
-        logger.info("Saved timers to file: %s", data)
+        write_json_atomic(TIMERS_PATH, data)
+        logger.info("Saved %d timer(s) to file", len(data))
+        logger.debug("Saved timers: %s", data)
     except Exception as e:
         logger.error("Failed to save timers: %s", e)
 
 
+# Timer changes are collected for this long before the file is rewritten
+TIMERS_SAVE_DELAY: Final[float] = 0.5
+_TIMERS_CHANGED: Final[asyncio.Event] = asyncio.Event()
+_timers_saver_task: asyncio.Task | None = None
+
+
+def request_timers_save() -> None:
+    """Mark timers as changed so the background saver writes them shortly."""
+    _TIMERS_CHANGED.set()
+
+
+async def flush_timers() -> None:
+    """Write pending timer changes to disk in a worker thread, if there are any.
+
+    The write is shielded from cancellation, so stopping the saver never
+    leaves an unfinished write racing with a later one.
+    """
+    if not _TIMERS_CHANGED.is_set():
+        return
+
+    _TIMERS_CHANGED.clear()
+    write = asyncio.ensure_future(asyncio.to_thread(save_timers, serialize_timers()))
+    try:
+        await asyncio.shield(write)
+    except asyncio.CancelledError:
+        await write
+        raise
+
+
+async def timers_saver() -> None:
+    """Write the timers file after changes, coalescing bursts into one write."""
+    while True:
+        await _TIMERS_CHANGED.wait()
+        await asyncio.sleep(TIMERS_SAVE_DELAY)
+        await flush_timers()
+
+
+@dataclass(slots=True, frozen=True)
+class TimerData:
+    """Payload attached to a scheduled feeding job."""
+
+    timer_key: str
+    portions: int
+
+
 async def timer_callback(context: ContextTypes.DEFAULT_TYPE) -> None:
     """Execute scheduled feeding."""
-    portions = context.job.data.get("portions", PORTIONS)
-    timer_key = context.job.data.get("timer_key", "unknown")
+    data: TimerData = context.job.data
+    portions = data.portions
+    timer_key = data.timer_key
 
     logger.info("Timer %s triggered, feeding %d portions", timer_key, portions)
 
     try:
-        trigger_feed(portions)
+        await trigger_feed_async(portions)
         logger.info("Scheduled feeding completed for timer %s", timer_key)
     except Exception as e:
         logger.error(
@@ -286,25 +749,47 @@ async def timer_callback(context: ContextTypes.DEFAULT_TYPE) -> None:
 # ---------------------------------------------------------------------------
 
 
-def schedule_timer(job_queue: JobQueue, timer_key: str, portions: int) -> None:
+# Accepts "8:00" as well as "08:00"; hours 0-23, minutes 0-59
+_HHMM_RE: Final[re.Pattern[str]] = re.compile(r"([01]?\d|2[0-3]):([0-5]?\d)")
+
+
+def parse_hhmm(text: str) -> tuple[int, int] | None:
+    """Parse a time of day in HH:MM format.
+
+    Args:
+        text: Time string such as "08:00".
+
+    Returns:
+        (hour, minute) tuple, or None if the string is not a valid time.
+    """
+    match = _HHMM_RE.fullmatch(text)
+    if match is None:
+        return None
+    return int(match.group(1)), int(match.group(2))
+
+
+def schedule_timer(job_queue: JobQueue, hour: int, minute: int, portions: int) -> None:
     """Schedule a daily feeding timer.
 
     Args:
         job_queue: Telegram job queue instance.
-        timer_key: Time string in HH:MM format.
+        hour: Hour of the feeding time (0-23).
+        minute: Minute of the feeding time (0-59).
         portions: Number of portions to feed.
     """
+    timer_key = f"{hour:02d}:{minute:02d}"
     try:
-        hour, minute = map(int, timer_key.split(":"))
         feed_time = time(hour=hour, minute=minute, tzinfo=TIMEZONE)
 
         job = job_queue.run_daily(
             timer_callback,
             time=feed_time,
-            data={"timer_key": timer_key, "portions": portions},
+            data=TimerData(timer_key, portions),
             name=f"timer_{timer_key}",
         )
 
+        if timer_key not in TIMERS:
+            bisect.insort(_TIMER_KEYS_SORTED, timer_key)
         TIMERS[timer_key] = {"portions": portions, "job": job}
         logger.info("Scheduled timer %s for %d portions", timer_key, portions)
     except Exception as e:
@@ -320,12 +805,98 @@ def init_timers(job_queue: JobQueue) -> None:
     """
     saved_timers = load_timers()
     for timer_key, data in saved_timers.items():
+        parsed = parse_hhmm(timer_key)
+        if parsed is None:
+            logger.error("Skipping saved timer with invalid time: %s", timer_key)
+            continue
         try:
-            schedule_timer(job_queue, timer_key, data["portions"])
+            schedule_timer(job_queue, *parsed, data["portions"])
         except Exception as e:
             logger.error("Failed to restore timer %s: %s", timer_key, e)
 
 
+# ---------------------------------------------------------------------------
+# Reply texts
+# ---------------------------------------------------------------------------
+
+_DENIED_MSG: Final[str] = "⛔ Access denied."
+_DEVICE_ERROR_MSG: Final[str] = (
+    "❌ Failed to communicate with the feeder. Check the device connection."
+)
+_INVALID_TIME_MSG: Final[str] = "⚠️ Invalid time format. Use HH:MM (e.g., 08:00)"
+
+_GREETING_TEMPLATE: Final[str] = (
+    "👋 Hello, {name}!\n\n"
+    "Pet Feeder Bot is ready. Use /help to see available commands."
+)
+
+_HELP_HEADER: Final[str] = (
+    "📖 *Available Commands:*\n\n"
+    "/myid — Get your Telegram user ID\n"
+    "/help — Show this help message\n"
+)
+_HELP_PUBLIC: Final[str] = (
+    _HELP_HEADER + "\n_Contact an authorized user to get access._"
+)
+_HELP_AUTHED: Final[str] = _HELP_HEADER + (
+    "\n*Feeder Control:*\n"
+    f"/feed — Feed the pet ({PORTIONS} portions)\n"
+    "/status — Check device status\n"
+    "\n*Timer Management:*\n"
+    "/addtimer HH:MM portions — Schedule feeding\n"
+    "/timers — List all scheduled feedings\n"
+    "/deletetimer HH:MM — Remove scheduled feeding\n"
+    "\n*User Management:*\n"
+    "/adduser <user\\_id> — Add user to allowed list\n"
+)
+
+_MYID_TEMPLATE: Final[str] = "🆔 Your Telegram user ID: `{user_id}`"
+
+_ADDUSER_USAGE_MSG: Final[str] = "Usage: `/adduser <user_id>`"
+_INVALID_USER_ID_MSG: Final[str] = "⚠️ Invalid user ID. Please provide a numeric ID."
+_USER_EXISTS_TEMPLATE: Final[str] = (
+    "ℹ️ User `{user_id}` is already in the allowed list."
+)
+_USER_ADDED_TEMPLATE: Final[str] = (
+    "✅ User `{user_id}` has been added to the allowed list."
+)
+
+_FED_MSG: Final[str] = f"✅ Fed the pet! Dispensed {PORTIONS} portion(s)."
+_FEED_ERROR_TEMPLATE: Final[str] = (
+    "⚠️ Feed command sent but device returned an error:\n`{error}`"
+)
+
+_STATUS_TEMPLATE: Final[str] = "📊 *Device Status*\n\n{lines}"
+_STATUS_LINE_TEMPLATE: Final[str] = "  `{name}`: `{value}`"
+_STATUS_NO_DATA_MSG: Final[str] = "  (no data points)"
+_STATUS_ERROR_TEMPLATE: Final[str] = "⚠️ Device returned an error:\n`{error}`"
+
+_ADDTIMER_USAGE_MSG: Final[str] = (
+    "Usage: `/addtimer HH:MM portions`\nExample: `/addtimer 08:00 2`"
+)
+_INVALID_PORTIONS_MSG: Final[str] = (
+    "⚠️ Invalid portions number. Must be a positive integer."
+)
+_TIMER_EXISTS_TEMPLATE: Final[str] = (
+    "ℹ️ Timer for `{timer_key}` already exists. Delete it first with /deletetimer"
+)
+_TIMER_ADDED_TEMPLATE: Final[str] = (
+    "✅ Timer added: `{timer_key}` — {portions} portion(s)"
+)
+_TIMER_ADD_FAILED_TEMPLATE: Final[str] = "❌ Failed to add timer: {error}"
+
+_NO_TIMERS_MSG: Final[str] = "ℹ️ No timers scheduled."
+_TIMERS_HEADER: Final[str] = "⏰ *Scheduled Timers:*\n"
+_TIMER_LINE_TEMPLATE: Final[str] = "• `{timer_key}` — {portions} portion(s)"
+
+_DELETETIMER_USAGE_MSG: Final[str] = (
+    "Usage: `/deletetimer HH:MM`\nExample: `/deletetimer 08:00`"
+)
+_TIMER_NOT_FOUND_TEMPLATE: Final[str] = "ℹ️ Timer `{timer_key}` not found."
+_TIMER_DELETED_TEMPLATE: Final[str] = "✅ Timer `{timer_key}` deleted."
+_TIMER_DELETE_FAILED_TEMPLATE: Final[str] = "❌ Failed to delete timer: {error}"
+
+
 # ---------------------------------------------------------------------------
 # Bot handlers
 # ---------------------------------------------------------------------------
@@ -334,16 +905,9 @@ def init_timers(job_queue: JobQueue) -> None:
 async def cmd_start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle the /start command — greet the user."""
     user = update.effective_user
-    if user is None or not is_authorized(user.id):
-        logger.warning("Unauthorized access attempt from user %s", user)
-        await update.message.reply_text("⛔ Access denied.")
-        return
 
     logger.info("User %s (%d) started the bot", user.full_name, user.id)
-    await update.message.reply_text(
-        f"👋 Hello, {user.first_name}!\n\n"
-        f"Pet Feeder Bot is ready. Use /help to see available commands."
-    )
+    await update.message.reply_text(_GREETING_TEMPLATE.format(name=user.first_name))
 
 
 async def cmd_help(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -352,27 +916,7 @@ async def cmd_help(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     if user is None:
         return
 
-    help_text = (
-        "📖 *Available Commands:*\n\n"
-        "/myid — Get your Telegram user ID\n"
-        "/help — Show this help message\n"
-    )
-
-    if user and is_authorized(user.id):
-        help_text += (
-            "\n*Feeder Control:*\n"
-            f"/feed — Feed the pet ({PORTIONS} portions)\n"
-            "/status — Check device status\n"
-            "\n*Timer Management:*\n"
-            "/addtimer HH:MM portions — Schedule feeding\n"
-            "/timers — List all scheduled feedings\n"
-            "/deletetimer HH:MM — Remove scheduled feeding\n"
-            "\n*User Management:*\n"
-            "/adduser <user\\_id> — Add user to allowed list\n"
-        )
-    else:
-        help_text += "\n_Contact an authorized user to get access._"
-
+    help_text = _HELP_AUTHED if is_authorized(user.id) else _HELP_PUBLIC
     await update.message.reply_text(help_text, parse_mode="Markdown")
 
 
@@ -384,46 +928,42 @@ async def cmd_myid(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
 
     logger.info("User %s (%d) requested their ID", user.full_name, user.id)
     await update.message.reply_text(
-        f"🆔 Your Telegram user ID: `{user.id}`", parse_mode="Markdown"
+        _MYID_TEMPLATE.format(user_id=user.id), parse_mode="Markdown"
     )
 
 
 async def cmd_adduser(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle the /adduser <id> command — add a user ID to the allowed list (auth required)."""
+    global ALLOWED_USER_IDS
     user = update.effective_user
-    if user is None or not is_authorized(user.id):
-        logger.warning("Unauthorized /adduser attempt from user %s", user)
-        await update.message.reply_text("⛔ Access denied.")
-        return
 
     if not context.args:
-        await update.message.reply_text(
-            "Usage: `/adduser <user_id>`", parse_mode="Markdown"
-        )
+        enqueue_reply(update.message, _ADDUSER_USAGE_MSG, parse_mode="Markdown")
         return
 
     try:
         new_uid = int(context.args[0])
     except ValueError:
-        await update.message.reply_text(
-            "⚠️ Invalid user ID. Please provide a numeric ID."
-        )
+        enqueue_reply(update.message, _INVALID_USER_ID_MSG)
         return
 
     if new_uid in ALLOWED_USER_IDS:
-        await update.message.reply_text(
-            f"ℹ️ User `{new_uid}` is already in the allowed list.", parse_mode="Markdown"
+        enqueue_reply(
+            update.message,
+            _USER_EXISTS_TEMPLATE.format(user_id=new_uid),
+            parse_mode="Markdown",
         )
         return
 
-    ALLOWED_USER_IDS.add(new_uid)
-    save_allowed_user_ids()
+    ALLOWED_USER_IDS = ALLOWED_USER_IDS | {new_uid}
+    AUTHORIZED_USERS.add_user_ids(new_uid)
+    await asyncio.to_thread(append_allowed_user_id, new_uid)
 
     logger.info(
         "User %s (%d) added user %d to allowed list", user.full_name, user.id, new_uid
     )
     await update.message.reply_text(
-        f"✅ User `{new_uid}` has been added to the allowed list.",
+        _USER_ADDED_TEMPLATE.format(user_id=new_uid),
         parse_mode="Markdown",
     )
 
@@ -431,63 +971,63 @@ async def cmd_adduser(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
 async def cmd_feed(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle the /feed command — feed the pet."""
     user = update.effective_user
-    if user is None or not is_authorized(user.id):
-        logger.warning("Unauthorized /feed attempt from user %s", user)
-        await update.message.reply_text("⛔ Access denied.")
+    if not allow_request(user.id):
+        logger.info("Rate limited /feed from user %s (%d)", user.full_name, user.id)
         return
 
     logger.info("User %s (%d) requested feeding", user.full_name, user.id)
 
     try:
-        result = trigger_feed()
+        result = await trigger_feed_async()
         error = result.get("Error") if isinstance(result, dict) else None
 
         if error:
-            text = f"⚠️ Feed command sent but device returned an error:\n`{error}`"
+            text = _FEED_ERROR_TEMPLATE.format(error=error)
             logger.error("Feed error: %s", error)
         else:
-            text = f"✅ Fed the pet! Dispensed {PORTIONS} portion(s)."
+            text = _FED_MSG
     except Exception:
         logger.exception("Failed to send feed command")
-        text = "❌ Failed to communicate with the feeder. Check the device connection."
+        text = _DEVICE_ERROR_MSG
 
     await update.message.reply_text(text)
 
 
+def _dp_sort_key(item: tuple[str, object]) -> tuple[int, int | str]:
+    """Sort key for status data points: numeric IDs in numeric order first."""
+    dp = item[0]
+    return (0, int(dp)) if dp.isdigit() else (1, dp)
+
+
 async def cmd_status(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle the /status command — query device status."""
     user = update.effective_user
-    if user is None or not is_authorized(user.id):
-        logger.warning("Unauthorized /status attempt from user %s", user)
-        await update.message.reply_text("⛔ Access denied.")
+    if not allow_request(user.id):
+        logger.info("Rate limited /status from user %s (%d)", user.full_name, user.id)
         return
 
     logger.info("User %s (%d) requested status", user.full_name, user.id)
 
     try:
-        status = query_status()
+        status = await query_status_async()
         error = status.get("Error") if isinstance(status, dict) else None
 
         if error:
-            text = f"⚠️ Device returned an error:\n`{error}`"
+            text = _STATUS_ERROR_TEMPLATE.format(error=error)
             logger.error("Status error: %s", error)
         else:
-            dp_names = {
-                "3": "manual_feed",
-                "4": "feed_state",
-                "11": "charge_state",
-                "14": "feed_report",
-            }
             dps = status.get("dps", {})
-            lines = [
-                f"  `{dp_names.get(str(dp), dp)}`: `{value}`"
-                for dp, value in sorted(dps.items(), key=lambda x: str(x[0]))
-            ]
-            dps_text = "\n".join(lines) if lines else "  (no data points)"
-            text = f"📊 *Device Status*\n\n{dps_text}"
+            dps_text = (
+                "\n".join(
+                    _STATUS_LINE_TEMPLATE.format(name=DP_NAMES.get(dp, dp), value=value)
+                    for dp, value in sorted(dps.items(), key=_dp_sort_key)
+                )
+                or _STATUS_NO_DATA_MSG
+            )
+            text = _STATUS_TEMPLATE.format(lines=dps_text)
     except Exception:
         logger.exception("Failed to query device status")
-        text = "❌ Failed to communicate with the feeder. Check the device connection."
+        text = _DEVICE_ERROR_MSG
 
     await update.message.reply_text(text, parse_mode="Markdown")
 
@@ -495,31 +1035,22 @@ async def cmd_status(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None
 async def cmd_addtimer(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle the /addtimer HH:MM portions command — schedule a feeding timer."""
     user = update.effective_user
-    if user is None or not is_authorized(user.id):
-        logger.warning("Unauthorized /addtimer attempt from user %s", user)
-        await update.message.reply_text("⛔ Access denied.")
-        return
 
     if len(context.args) < 2:
-        await update.message.reply_text(
-            "Usage: `/addtimer HH:MM portions`\nExample: `/addtimer 08:00 2`",
+        enqueue_reply(
+            update.message,
+            _ADDTIMER_USAGE_MSG,
             parse_mode="Markdown",
         )
         return
 
-    timer_key = context.args[0]
-
     # Validate time format
-    try:
-        hour, minute = map(int, timer_key.split(":"))
-        if not (0 <= hour < 24 and 0 <= minute < 60):
-            raise ValueError("Invalid time range")
-        timer_key = f"{hour:02d}:{minute:02d}"  # Normalize format
-    except (ValueError, AttributeError):
-        await update.message.reply_text(
-            "⚠️ Invalid time format. Use HH:MM (e.g., 08:00)"
-        )
+    parsed = parse_hhmm(context.args[0])
+    if parsed is None:
+        enqueue_reply(update.message, _INVALID_TIME_MSG)
         return
+    hour, minute = parsed
+    timer_key = f"{hour:02d}:{minute:02d}"  # Normalize format
 
     # Validate portions
     try:
@@ -527,23 +1058,22 @@ async def cmd_addtimer(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
         if portions <= 0:
             raise ValueError("Portions must be positive")
     except ValueError:
-        await update.message.reply_text(
-            "⚠️ Invalid portions number. Must be a positive integer."
-        )
+        enqueue_reply(update.message, _INVALID_PORTIONS_MSG)
         return
 
     # Check if timer already exists
     if timer_key in TIMERS:
-        await update.message.reply_text(
-            f"ℹ️ Timer for `{timer_key}` already exists. Delete it first with /deletetimer",
+        enqueue_reply(
+            update.message,
+            _TIMER_EXISTS_TEMPLATE.format(timer_key=timer_key),
             parse_mode="Markdown",
         )
         return
 
     # Schedule the timer
     try:
-        schedule_timer(context.application.job_queue, timer_key, portions)
-        save_timers()
+        schedule_timer(context.application.job_queue, hour, minute, portions)
+        request_timers_save()
 
         logger.info(
             "User %s (%d) added timer %s with %d portions",
@@ -553,30 +1083,26 @@ async def cmd_addtimer(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
             portions,
         )
         await update.message.reply_text(
-            f"✅ Timer added: `{timer_key}` — {portions} portion(s)",
+            _TIMER_ADDED_TEMPLATE.format(timer_key=timer_key, portions=portions),
             parse_mode="Markdown",
         )
     except Exception as e:
         logger.exception("Failed to add timer %s", timer_key)
-        await update.message.reply_text(f"❌ Failed to add timer: {e}")
+        await update.message.reply_text(_TIMER_ADD_FAILED_TEMPLATE.format(error=e))
 
 
 async def cmd_timers(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle the /timers command — list all scheduled timers."""
-    user = update.effective_user
-    if user is None or not is_authorized(user.id):
-        logger.warning("Unauthorized /timers attempt from user %s", user)
-        await update.message.reply_text("⛔ Access denied.")
-        return
-
     if not TIMERS:
-        await update.message.reply_text("ℹ️ No timers scheduled.")
+        await update.message.reply_text(_NO_TIMERS_MSG)
         return
 
-    lines = ["⏰ *Scheduled Timers:*\n"]
-    for timer_key in sorted(TIMERS.keys()):
+    lines = [_TIMERS_HEADER]
+    for timer_key in _TIMER_KEYS_SORTED:
         portions = TIMERS[timer_key]["portions"]
-        lines.append(f"• `{timer_key}` — {portions} portion(s)")
+        lines.append(
+            _TIMER_LINE_TEMPLATE.format(timer_key=timer_key, portions=portions)
+        )
 
     await update.message.reply_text("\n".join(lines), parse_mode="Markdown")
 
@@ -584,33 +1110,28 @@ async def cmd_timers(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None
 async def cmd_deletetimer(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle the /deletetimer HH:MM command — remove a scheduled timer."""
     user = update.effective_user
-    if user is None or not is_authorized(user.id):
-        logger.warning("Unauthorized /deletetimer attempt from user %s", user)
-        await update.message.reply_text("⛔ Access denied.")
-        return
 
     if not context.args:
-        await update.message.reply_text(
-            "Usage: `/deletetimer HH:MM`\nExample: `/deletetimer 08:00`",
+        enqueue_reply(
+            update.message,
+            _DELETETIMER_USAGE_MSG,
             parse_mode="Markdown",
         )
         return
 
-    timer_key = context.args[0]
-
     # Normalize format
-    try:
-        hour, minute = map(int, timer_key.split(":"))
-        timer_key = f"{hour:02d}:{minute:02d}"
-    except (ValueError, AttributeError):
-        await update.message.reply_text(
-            "⚠️ Invalid time format. Use HH:MM (e.g., 08:00)"
-        )
+    parsed = parse_hhmm(context.args[0])
+    if parsed is None:
+        enqueue_reply(update.message, _INVALID_TIME_MSG)
         return
+    hour, minute = parsed
+    timer_key = f"{hour:02d}:{minute:02d}"
 
     if timer_key not in TIMERS:
-        await update.message.reply_text(
-            f"ℹ️ Timer `{timer_key}` not found.", parse_mode="Markdown"
+        enqueue_reply(
+            update.message,
+            _TIMER_NOT_FOUND_TEMPLATE.format(timer_key=timer_key),
+            parse_mode="Markdown",
         )
         return
 
@@ -621,15 +1142,38 @@ async def cmd_deletetimer(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             job.schedule_removal()
 
         del TIMERS[timer_key]
-        save_timers()
+        _TIMER_KEYS_SORTED.remove(timer_key)
+        request_timers_save()
 
         logger.info("User %s (%d) deleted timer %s", user.full_name, user.id, timer_key)
         await update.message.reply_text(
-            f"✅ Timer `{timer_key}` deleted.", parse_mode="Markdown"
+            _TIMER_DELETED_TEMPLATE.format(timer_key=timer_key), parse_mode="Markdown"
         )
     except Exception as e:
         logger.exception("Failed to delete timer %s", timer_key)
-        await update.message.reply_text(f"❌ Failed to delete timer: {e}")
+        await update.message.reply_text(_TIMER_DELETE_FAILED_TEMPLATE.format(error=e))
+
+
+async def cmd_denied(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Handle a protected command sent by a user who is not allowed."""
+    user = update.effective_user
+    if user is None:
+        return
+
+    command = update.message.text.split(maxsplit=1)[0]
+    logger.warning("Unauthorized %s attempt from user_id=%d", command, user.id)
+
+    # Keep the table bounded when many distinct IDs probe the bot
+    if len(_DENIED_BUCKETS) >= DENIED_BUCKETS_PRUNE_SIZE:
+        prune_buckets(_DENIED_BUCKETS, DENIED_REPLY_RATE, DENIED_REPLY_BURST)
+
+    # Repeated attempts are not answered, so scanners cost no outgoing requests
+    if not allow_request(
+        user.id, _DENIED_BUCKETS, DENIED_REPLY_RATE, DENIED_REPLY_BURST
+    ):
+        return
+
+    enqueue_reply(update.message, _DENIED_MSG)
 
 
 # ---------------------------------------------------------------------------
@@ -638,29 +1182,78 @@ async def cmd_deletetimer(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
 
 
 async def post_init(application: Application) -> None:
-    """Initialize timers after the application is ready."""
+    """Restore saved timers and start the background tasks."""
+    global _timers_saver_task, _reply_sender_task
     init_timers(application.job_queue)
+    _timers_saver_task = asyncio.create_task(timers_saver())
+    _reply_sender_task = asyncio.create_task(reply_sender())
+
+
+async def post_stop(application: Application) -> None:
+    """Stop the background tasks, sending queued replies and pending timers.
+
+    The in-memory timer registry is emptied only after the final save, so
+    the timers file keeps every configured feeding. The jobs themselves
+    need no removal: stopping the JobQueue has already shut down the
+    scheduler along with every job in it.
+    """
+    if _reply_sender_task is not None:
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(_REPLY_QUEUE.join(), timeout=REPLY_DRAIN_TIMEOUT)
+        _reply_sender_task.cancel()
+    if _timers_saver_task is not None:
+        _timers_saver_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _timers_saver_task
+    await flush_timers()
+
+    TIMERS.clear()
+    _TIMER_KEYS_SORTED.clear()
 
 
 def main() -> None:
     """Build and run the Telegram bot application."""
     logger.info("Starting Pet Feeder Bot...")
 
-    application = Application.builder().token(BOT_TOKEN).post_init(post_init).build()
+    application = (
+        Application.builder()
+        .token(BOT_TOKEN)
+        .post_init(post_init)
+        .post_stop(post_stop)
+        # Handle independent updates in parallel; device calls are serialized
+        # by the single-worker _DEVICE_EXECUTOR
+        .concurrent_updates(True)
+        # Keep a larger pool of reusable connections for outgoing requests
+        .connection_pool_size(32)
+        .pool_timeout(5)
+        .get_updates_connect_timeout(10)
+        .build()
+    )
 
     # Register handlers
-    application.add_handler(CommandHandler("start", cmd_start))
+    authorized = filters.UpdateType.MESSAGE & AUTHORIZED_USERS
+    protected = {
+        "start": cmd_start,
+        "adduser": cmd_adduser,
+        "feed": cmd_feed,
+        "status": cmd_status,
+        "addtimer": cmd_addtimer,
+        "timers": cmd_timers,
+        "deletetimer": cmd_deletetimer,
+    }
     application.add_handler(CommandHandler("help", cmd_help))
     application.add_handler(CommandHandler("myid", cmd_myid))
-    application.add_handler(CommandHandler("adduser", cmd_adduser))
-    application.add_handler(CommandHandler("feed", cmd_feed))
-    application.add_handler(CommandHandler("status", cmd_status))
-    application.add_handler(CommandHandler("addtimer", cmd_addtimer))
-    application.add_handler(CommandHandler("timers", cmd_timers))
-    application.add_handler(CommandHandler("deletetimer", cmd_deletetimer))
+    for command, callback in protected.items():
+        application.add_handler(CommandHandler(command, callback, filters=authorized))
+    # Protected commands not matched above come from unauthorized users
+    application.add_handler(CommandHandler(protected.keys(), cmd_denied))
 
     logger.info("Bot is polling for updates...")
-    application.run_polling(allowed_updates=Update.ALL_TYPES)
+    # A long server-side poll timeout keeps an idle bot to ~1 request per minute.
+    # Only plain messages are requested, since all handlers are commands.
+    application.run_polling(
+        timeout=50, poll_interval=0, allowed_updates=[Update.MESSAGE]
+    )
 
 
 if __name__ == "__main__":